@@ -10,6 +10,7 @@ from modypy.simulation import Simulator, SimulationResult
 # Define the system parameters
 G = 6.67e-11  # m^3/s^2
 SUN_MASS = 1.989e30  # kg
+SUN_GM = G * SUN_MASS  # m^3/s^2
 
 # Parameter of the Earth Orbit
 PERIHEL = 147.1e9  # m
@@ -28,8 +29,8 @@ system = System()
 def velocity_dt(system_state):
     """Calculate the derivative of the velocity"""
     pos = position(system_state)
-    distance = linalg.norm(pos, axis=0)
-    return -G * SUN_MASS / (distance ** 3) * pos
+    distance_squared = pos[0] ** 2 + pos[1] ** 2
+    return (-SUN_GM * distance_squared ** -1.5) * pos
 
 
 # Create the states
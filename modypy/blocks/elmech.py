@@ -4,7 +4,10 @@ A collection fo electro-mechanical blocks.
 
 import math
 
-from modypy.model import Block, Port, State, signal_method
+import numpy as np
+from modypy.model import Block, Port, Signal, State, signal_method
+
+_INVERSE_TWO_PI = 1.0 / (2 * math.pi)
 
 
 class DCMotor(Block):
@@ -59,6 +62,9 @@ class DCMotor(Block):
         self.inductance = inductance
         self.moment_of_inertia = moment_of_inertia
 
+        self._inverse_inductance = 1.0 / inductance
+        self._inverse_moment_of_inertia = 1.0 / moment_of_inertia
+
         self.voltage = Port()
         self.external_torque = Port()
 
@@ -73,28 +79,37 @@ class DCMotor(Block):
             initial_condition=initial_current,
         )
 
+        # Both derivatives are determined together in a single signal, so that
+        # states and inputs are only accessed once per evaluation.
+        self._derivatives = Signal(shape=2, value=self._calculate_derivatives)
+
     def omega_dot(self, data):
         """Calculates the derivative of the speed in rad/s^2"""
-        current = self.current(data)
-        tau_ext = self.external_torque(data)
-        return (
-            self.motor_constant * current - tau_ext
-        ) / self.moment_of_inertia
+        return self._derivatives(data)[0]
 
     def current_dot(self, data):
         """Calculates the derivative of the current in A/s"""
+        return self._derivatives(data)[1]
+
+    def _calculate_derivatives(self, data):
+        """Calculates the derivatives of speed and current"""
         omega = self.omega(data)
         current = self.current(data)
         voltage = self.voltage(data)
+        tau_ext = self.external_torque(data)
 
-        return (
+        omega_dot = (
+            self.motor_constant * current - tau_ext
+        ) * self._inverse_moment_of_inertia
+        current_dot = (
             voltage - self.motor_constant * omega - self.resistance * current
-        ) / self.inductance
+        ) * self._inverse_inductance
+        return np.array([omega_dot, current_dot])
 
     @signal_method
     def speed_rps(self, data):
         """Calculates the current speed in RPS"""
-        return self.omega(data) / (2 * math.pi)
+        return self.omega(data) * _INVERSE_TWO_PI
 
     @signal_method
     def torque(self, data):
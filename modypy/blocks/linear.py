@@ -1,7 +1,7 @@
 """Blocks for linear, time-invariant systems"""
 import numpy as np
 from functools import partial
-from modypy.model import Block, Port, Signal, State
+from modypy.model import Block, InputSignal, Port, Signal, State
 
 
 class InvalidLTIException(RuntimeError):
@@ -17,6 +17,14 @@ class LTISystem(Block):
 
     The matrices ``system_matrix``, ``input_matrix``, ``output_matrix`` and
     ``feed_through_matrix`` define the state and output behaviour of the block.
+
+    The matrices are stored with the floating point type given by ``dtype``
+    (default: ``np.float64``). For large systems, using ``np.float32`` halves
+    the memory traffic for evaluating the products, at the cost of precision.
+    Note that the state itself is always kept in double precision by the
+    simulator. If the simulator determines the state derivative of the whole
+    system by a single matrix product, that matrix is also assembled in double
+    precision, so in that case ``dtype`` has no effect on the simulation.
     """
 
     def __init__(
@@ -27,6 +35,7 @@ class LTISystem(Block):
         output_matrix,
         feed_through_matrix,
         initial_condition=None,
+        dtype=np.float64,
     ):
         Block.__init__(self, parent)
 
@@ -172,46 +181,230 @@ class LTISystem(Block):
                     "matrix"
                 )
 
-        self.system_matrix = system_matrix
-        self.input_matrix = input_matrix
-        self.output_matrix = output_matrix
-        self.feed_through_matrix = feed_through_matrix
+        self.dtype = dtype
+        self.system_matrix = _as_float_matrix(system_matrix, dtype)
+        self.input_matrix = _as_float_matrix(input_matrix, dtype)
+        self.output_matrix = _as_float_matrix(output_matrix, dtype)
+        self.feed_through_matrix = _as_float_matrix(feed_through_matrix, dtype)
 
         self.input = Port(shape=self.input_shape)
+        # Each access to a method creates a new bound method object, so the
+        # one passed to the state is kept for identifying it later.
+        self._state_derivative_function = self.state_derivative
         self.state = State(
             self,
             shape=self.state_shape,
-            derivative_function=self.state_derivative,
+            derivative_function=self._state_derivative_function,
             initial_condition=initial_condition,
         )
+        self.state.affine_dynamics = self._affine_dynamics
         self.output = Signal(
             shape=self.output_shape, value=self.output_function
         )
 
-    def state_derivative(self, data):
-        """Calculates the state derivative for the system"""
-        if self.state.shape == ():
-            derivative = self.system_matrix * self.state(data)
+        self._state_product = _select_product(self.state.shape)
+        if self.input.size > 0:
+            self._input_product = _select_product(self.input.shape)
         else:
-            derivative = np.matmul(self.system_matrix, self.state(data))
-        if self.input.shape == ():
-            derivative += self.input_matrix * self.input(data)
-        elif self.input.size > 0:
-            derivative += np.matmul(self.input_matrix, self.input(data))
+            self._input_product = None
+
+        # If both state and input are vectors, the state derivative and the
+        # output can each be determined by a single product of a stacked matrix
+        # and the stacked vector of state and input.
+        self._state_input_matrix = _stack_matrices(
+            self.state.shape,
+            self.input.shape,
+            self.system_matrix,
+            self.input_matrix,
+        )
+        self._output_feed_through_matrix = _stack_matrices(
+            self.state.shape,
+            self.input.shape,
+            self.output_matrix,
+            self.feed_through_matrix,
+        )
+        self._state_input_buffer = np.empty(
+            self.state.size + self.input.size, dtype=dtype
+        )
+
+        # The state derivative is only ever copied into the state derivative
+        # vector of the system, so for single samples of vector states we can
+        # provide it in a pre-allocated buffer.
+        self._derivative_buffer = np.empty(self.state.size, dtype=dtype)
+
+    def state_derivative(self, data):
+        """Calculates the state derivative for the system
+
+        For single samples of vector states, the derivative is provided in a
+        buffer that is re-used by subsequent calls.
+        """
+        state = self.state(data)
+        if self._input_product is None:
+            if len(self.state.shape) == np.ndim(state) == 1:
+                # Without inputs, the buffer has exactly the size of the state.
+                # Copying the state converts it to the type of the matrices.
+                buffer = self._state_input_buffer
+                buffer[:] = state
+                return np.matmul(
+                    self.system_matrix, buffer, out=self._derivative_buffer
+                )
+            return self._state_product(self.system_matrix, state)
+        inputs = self.input(data)
+        if (
+            self._state_input_matrix is not None
+            and np.ndim(state) == np.ndim(inputs) == 1
+        ):
+            return np.matmul(
+                self._state_input_matrix,
+                self._stack_state_and_input(state, inputs),
+                out=self._derivative_buffer,
+            )
+        derivative = self._state_product(self.system_matrix, state)
+        derivative += self._input_product(self.input_matrix, inputs)
         return derivative
 
     def output_function(self, data):
         """Calculates the output for the system"""
-        if self.state.shape == ():
-            output = self.output_matrix * self.state(data)
-        else:
-            output = np.matmul(self.output_matrix, self.state(data))
-        if self.input.shape == ():
-            output += self.feed_through_matrix * self.input(data)
-        elif self.input.size > 0:
-            output += np.matmul(self.feed_through_matrix, self.input(data))
+        state = self.state(data)
+        if self._input_product is None:
+            return self._state_product(self.output_matrix, state)
+        inputs = self.input(data)
+        if (
+            self._output_feed_through_matrix is not None
+            and np.ndim(state) == np.ndim(inputs) == 1
+        ):
+            return np.matmul(
+                self._output_feed_through_matrix,
+                self._stack_state_and_input(state, inputs),
+            )
+        output = self._state_product(self.output_matrix, state)
+        output += self._input_product(self.feed_through_matrix, inputs)
         return output
 
+    def _affine_dynamics(self, data):
+        """Determine the state derivative as affine function of the state.
+
+        This is only possible if the input is constant, i.e. if it is either
+        connected to a signal with a constant value or to an input signal.
+        Further, the derivative function of the state must still be the
+        :meth:`state_derivative` method of this class, as otherwise the
+        derivative is not determined by the matrices.
+
+        Args:
+            data: The system state providing the value of input signals
+
+        Returns:
+            A tuple ``(matrix, offset)`` with the state derivative being
+            ``matrix @ state + offset``, or ``None`` if the input is not
+            constant or the derivative function has been replaced
+        """
+
+        if (
+            self.state.derivative_function
+            is not self._state_derivative_function
+            or type(self).state_derivative is not LTISystem.state_derivative
+        ):
+            return None
+        matrix = self.system_matrix
+        if self._input_product is None:
+            return matrix, np.zeros(self.state.shape)
+        signal = self.input.signal
+        if not (
+            isinstance(signal, InputSignal)
+            or (isinstance(signal, Signal) and not callable(signal.value))
+        ):
+            return None
+        return matrix, self._input_product(self.input_matrix, signal(data))
+
+    @property
+    def state_jacobian(self):
+        """The jacobian of the state derivative of the whole system with
+        respect to its state vector, as far as it is determined by this block.
+
+        The entries for the state of this block are given by the system matrix,
+        all other entries are zero. This is the exact jacobian if this is the
+        only block with continuous-time states in the system and its inputs do
+        not depend on the state, e.g. if they are provided by sources. In that
+        case, it can be passed as ``jac`` option to implicit solvers such as
+        :class:`BDF <scipy.integrate.BDF>` or
+        :class:`Radau <scipy.integrate.Radau>`, which then do not need to
+        approximate the jacobian by finite differences.
+        """
+
+        num_states = self.system.num_states
+        jacobian = np.zeros((num_states, num_states))
+        state_slice = self.state.state_slice
+        jacobian[state_slice, state_slice] = self.system_matrix
+        return jacobian
+
+    def _stack_state_and_input(self, state, inputs):
+        """Copy the given state and input vectors into the stacking buffer.
+
+        Args:
+            state: The state vector
+            inputs: The input vector
+
+        Returns:
+            The buffer containing the state followed by the inputs
+        """
+
+        buffer = self._state_input_buffer
+        buffer[: self.state.size] = state
+        buffer[self.state.size :] = inputs
+        return buffer
+
+
+def _as_float_matrix(matrix, dtype):
+    """Convert a matrix into a C-contiguous array of floats of the given type.
+
+    Scalars are kept as they are, as they are applied by multiplication.
+    """
+
+    if np.isscalar(matrix):
+        return matrix
+    return np.ascontiguousarray(matrix, dtype=dtype)
+
+
+def _stack_matrices(state_shape, input_shape, state_matrix, input_matrix):
+    """Stack the state and input matrices horizontally.
+
+    Args:
+        state_shape: The shape of the state
+        input_shape: The shape of the input
+        state_matrix: The matrix applied to the state
+        input_matrix: The matrix applied to the input
+
+    Returns:
+        The stacked matrix, or ``None`` if state and input are not both
+        vectors with matrices applied to them
+    """
+
+    if (
+        len(state_shape) != 1
+        or len(input_shape) != 1
+        or input_shape[0] == 0
+        or np.ndim(state_matrix) != 2
+        or np.ndim(input_matrix) != 2
+    ):
+        return None
+    return np.ascontiguousarray(np.hstack((state_matrix, input_matrix)))
+
+
+def _select_product(shape):
+    """Select the function to use for applying a matrix to a value of the given
+    shape.
+
+    Args:
+        shape: The shape of the value
+
+    Returns:
+        ``np.multiply`` for scalar values and ``np.matmul`` otherwise
+    """
+
+    if shape == ():
+        return np.multiply
+    return np.matmul
+
 
 class Gain(Block):
     """A simple linear gain block.
@@ -225,8 +418,16 @@ class Gain(Block):
         Block.__init__(self, parent)
         self.k = np.atleast_2d(k)
 
+        # For diagonal gains, an element-wise product is much cheaper than a
+        # full matrix product
+        if _is_diagonal(self.k):
+            self._diagonal = np.diag(self.k).copy()
+            output_function = self._diagonal_output_function
+        else:
+            output_function = self.output_function
+
         self.input = Port(shape=self.k.shape[0])
-        self.output = Signal(shape=self.k.shape[1], value=self.output_function)
+        self.output = Signal(shape=self.k.shape[1], value=output_function)
 
     def output_function(self, data):
         """Calculates the output for the system
@@ -238,6 +439,27 @@ class Gain(Block):
         """
         return self.k @ self.input(data)
 
+    def _diagonal_output_function(self, data):
+        """Calculates the output for the system with a diagonal gain"""
+        return _diagonal_gain_function(self._diagonal, self.input, data)
+
+
+def _is_diagonal(matrix):
+    """Determine whether the given matrix is a square diagonal matrix.
+
+    Args:
+        matrix: The matrix to check
+
+    Returns:
+        ``True`` if the matrix is a square diagonal matrix, ``False`` otherwise
+    """
+
+    return (
+        matrix.ndim == 2
+        and matrix.shape[0] == matrix.shape[1]
+        and np.count_nonzero(matrix - np.diag(np.diag(matrix))) == 0
+    )
+
 
 def _gain_function(gain_matrix, input_signal, data):
     """
@@ -255,6 +477,27 @@ def _gain_function(gain_matrix, input_signal, data):
     return np.matmul(gain_matrix, input_signal(data))
 
 
+def _diagonal_gain_function(diagonal, input_signal, data):
+    """
+    Calculate the product of a diagonal gain matrix and the value of the vector
+    signal.
+
+    Args:
+        diagonal: The diagonal of the gain matrix
+        input_signal: The input signal
+        data: The data provider
+
+    Returns:
+        The product of the gain matrix and the value of the signal
+    """
+
+    value = input_signal(data)
+    if np.ndim(value) == 1:
+        return diagonal * value
+    # For multiple samples, the last index is the sample index
+    return diagonal[:, np.newaxis] * value
+
+
 def _scalar_gain_function(gain_factor, input_signal, data):
     """
     Calculate the product of the given scalar gain and the value of the signal.
@@ -291,12 +534,27 @@ def gain(gain_matrix, input_signal):
             shape=input_signal.shape,
             value=partial(_scalar_gain_function, gain_matrix, input_signal),
         )
-    else:
-        output_shape = (gain_matrix @ np.zeros(input_signal.shape)).shape
+    gain_matrix = np.asarray(gain_matrix)
+    if (
+        len(input_signal.shape) == 1
+        and _is_diagonal(gain_matrix)
+        and gain_matrix.shape[1] == input_signal.shape[0]
+    ):
+        # For diagonal gains, an element-wise product is much cheaper than a
+        # full matrix product
         return Signal(
-            shape=output_shape,
-            value=partial(_gain_function, gain_matrix, input_signal),
+            shape=input_signal.shape,
+            value=partial(
+                _diagonal_gain_function,
+                np.diag(gain_matrix).copy(),
+                input_signal,
+            ),
         )
+    output_shape = (gain_matrix @ np.zeros(input_signal.shape)).shape
+    return Signal(
+        shape=output_shape,
+        value=partial(_gain_function, gain_matrix, input_signal),
+    )
 
 
 class Sum(Block):
@@ -7,6 +7,9 @@ def constant(value):
     """
     Create a constant signal
 
+    The value is converted to a contiguous array of floats once, so that it
+    does not need to be converted again whenever the signal is used.
+
     Args:
       value: The value of the signal
 
@@ -14,5 +17,5 @@ def constant(value):
       A signal with the required constant value
     """
 
-    return Signal(shape=np.shape(value),
-                  value=value)
+    value = np.require(value, dtype=np.float64, requirements="C")
+    return Signal(shape=value.shape, value=value)
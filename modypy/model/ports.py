@@ -104,12 +104,10 @@ class Port:
     def __call__(self, *args, **kwargs):
         if self.size == 0:
             return np.empty(self.shape)
-        if self.signal is None:
+        signal = self.signal
+        if signal is None:
             raise PortNotConnectedError()
-        # pylint does not recognize that self.signal is either None or Port,
-        # which _is_ callable.
-        # pylint: disable=not-callable
-        return self.signal(*args, **kwargs)
+        return signal(*args, **kwargs)
 
 
 class AbstractSignal(Port):
@@ -133,10 +131,60 @@ class Signal(AbstractSignal):
         super().__init__(*args, **kwargs)
         self.value = value
 
+    @property
+    def value(self):
+        """The value of the signal, either a constant or a callable"""
+        return self._value
+
+    @value.setter
+    def value(self, value):
+        self._value = value
+        self._is_constant = not callable(value)
+
     def __call__(self, *args, **kwargs):
-        if callable(self.value):
-            return self.value(*args, **kwargs)
-        return self.value
+        if self._is_constant:
+            return self._value
+        if len(args) == 1 and isinstance(args[0], SignalValueCache):
+            return args[0].get_signal_value(self)
+        return self._value(*args, **kwargs)
+
+
+_NOT_CACHED = object()
+
+
+class SignalValueCache:
+    """A ``SignalValueCache`` is a data provider that determines the value of
+    each signal at most once.
+
+    When called with such a data provider, a signal does not call its value
+    function directly, but requests its value from the data provider, which
+    will only call the value function on the first request. Thereby, signals
+    that are used by multiple other signals or states are not evaluated again
+    and again.
+
+    Data providers that allow the modification of states must not cache signal
+    values, as these would become invalid by the modification.
+    """
+
+    def __init__(self):
+        self._signal_values = dict()
+
+    def get_signal_value(self, signal: Signal):
+        """Determine the value of the given signal.
+
+        Args:
+            signal: The signal
+
+        Returns:
+            The value of the signal
+        """
+        # Most signals are requested for the first time when they are not yet in
+        # the cache, so we avoid raising KeyError for these.
+        value = self._signal_values.get(signal, _NOT_CACHED)
+        if value is _NOT_CACHED:
+            value = signal.value(self)
+            self._signal_values[signal] = value
+        return value
 
 
 def decorator(func):
@@ -225,6 +273,9 @@ class InputSignal(AbstractSignal):
         self.owner = owner
         self.input_index = self.owner.system.allocate_input_lines(self.size)
         self.owner.system.inputs.append(self)
+        self._input_slice = slice(
+            self.input_index, self.input_index + self.size
+        )
         if value is None:
             value = np.zeros(shape)
         self.value = value
@@ -234,7 +285,7 @@ class InputSignal(AbstractSignal):
         """A slice object that represents the indices of this input in the
         inputs vector."""
 
-        return slice(self.input_index, self.input_index + self.size)
+        return self._input_slice
 
     @property
     def input_range(self):
@@ -34,6 +34,13 @@ class State(AbstractSignal):
         super().__init__(shape)
         self.owner = owner
         self.derivative_function = derivative_function
+        # Blocks may provide a function that determines whether the derivative
+        # is an affine function of this state alone for the given system
+        # state, i.e. that it does not depend on any other state and only on
+        # constant inputs. In that case, it shall return a tuple
+        # ``(matrix, offset)`` with the derivative being given by
+        # ``matrix @ state + offset``, and ``None`` otherwise.
+        self.affine_dynamics = None
         if initial_condition is None:
             self.initial_condition = np.zeros(self.shape)
         else:
@@ -42,12 +49,16 @@ class State(AbstractSignal):
         self.state_index = self.owner.system.allocate_state_lines(self.size)
         self.owner.system.states.append(self)
 
+        self._state_slice = slice(
+            self.state_index, self.state_index + self.size
+        )
+
     @property
     def state_slice(self):
         """A slice object that represents the indices of this state in the
         states vector."""
 
-        return slice(self.state_index, self.state_index + self.size)
+        return self._state_slice
 
     def __call__(self, system_state):
         return system_state.get_state_value(self)
@@ -6,6 +6,7 @@ from typing import List
 
 import numpy as np
 
+from modypy.model.ports import SignalValueCache
 from modypy.model.states import State
 
 
@@ -126,18 +127,36 @@ class System:
         """Determine the value of all state derivative functions for the given
         system state.
 
+        The system state may also describe a batch of samples, e.g. multiple
+        trajectories evaluated at once, by providing an array of time instances
+        and a matrix of states with one column per sample. In that case, all
+        derivative functions are evaluated only once for the whole batch and
+        the result has one column per sample.
+
         Args:
             system_state: The state for which to determine the event values.
 
         Returns:
-            The vector of state derivatives for this system.
+            The vector of state derivatives for this system, or the matrix of
+            state derivatives with one column per sample.
         """
-        state_derivative = np.zeros(self.num_states)
+        sample_shape = np.shape(system_state.time)
+        state_derivative = np.zeros((self.num_states,) + sample_shape)
         for state_instance in self.states:
             if state_instance.derivative_function is not None:
-                state_derivative[state_instance.state_slice] = np.ravel(
-                    state_instance.derivative_function(system_state)
-                )
+                derivative = state_instance.derivative_function(system_state)
+                if sample_shape:
+                    derivative = np.asarray(derivative)
+                    if derivative.shape == state_instance.shape:
+                        # The derivative does not depend on the sample, so
+                        # we use the same value for all samples
+                        derivative = derivative[..., np.newaxis]
+                    derivative = np.broadcast_to(
+                        derivative, state_instance.shape + sample_shape
+                    ).reshape((state_instance.size,) + sample_shape)
+                else:
+                    derivative = np.ravel(derivative)
+                state_derivative[state_instance.state_slice] = derivative
         return state_derivative
 
 
@@ -149,11 +168,16 @@ class Block:
         self.system = self.parent.system
 
 
-class SystemState:
+class SystemState(SignalValueCache):
     """This class allows to evaluate the individual aspects (signals, state
-    derivatives, ...) of a system at any given time."""
+    derivatives, ...) of a system at any given time.
+
+    The value of each signal is determined at most once for a given system
+    state and re-used for all later accesses. A system state thus must not be
+    modified after signals have been evaluated on it."""
 
     def __init__(self, time, system: System, state=None, inputs=None):
+        super().__init__()
         self.time = time
         self.system = system
 
@@ -164,6 +188,14 @@ class SystemState:
             inputs = system.initial_input.copy()
         self.inputs = inputs
 
+        # Flag indicating whether this state represents multiple samples
+        self._multi_sample = not np.isscalar(time)
+
+        # The values of states and inputs are views into the state and input
+        # vector, so they only need to be created once
+        self._state_values = dict()
+        self._input_values = dict()
+
     def get_state_value(self, state: State):
         """Determine the value of a given state.
 
@@ -173,10 +205,15 @@ class SystemState:
         Returns:
           The value of the state
         """
-        if np.isscalar(self.time):
-            return self.state[state.state_slice].reshape(state.shape)
-        else:
-            return self.state[state.state_slice].reshape(state.shape + (-1,))
+        value = self._state_values.get(state)
+        if value is None:
+            value = self.state[state.state_slice]
+            if self._multi_sample:
+                value = value.reshape(state.shape + (-1,))
+            elif not value.ndim == len(state.shape) == 1:
+                value = value.reshape(state.shape)
+            self._state_values[state] = value
+        return value
 
     def get_input_value(self, signal):
         """Determine the value of a given input signal.
@@ -187,10 +224,15 @@ class SystemState:
         Returns:
             The value of the input signal
         """
-        if np.isscalar(self.time):
-            return self.inputs[signal.input_slice].reshape(signal.shape)
-        else:
-            return self.inputs[signal.input_slice].reshape(signal.shape + (-1,))
+        value = self._input_values.get(signal)
+        if value is None:
+            value = self.inputs[signal.input_slice]
+            if self._multi_sample:
+                value = value.reshape(signal.shape + (-1,))
+            elif not value.ndim == len(signal.shape) == 1:
+                value = value.reshape(signal.shape)
+            self._input_values[signal] = value
+        return value
 
     def __getitem__(self, key):
         warnings.warn(
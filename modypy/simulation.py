@@ -14,9 +14,25 @@ from modypy.model.system import System
 
 INITIAL_RESULT_SIZE = 16
 RESULT_SIZE_EXTENSION = 16
+RESULT_SIZE_GROWTH_FACTOR = 2
 
 DEFAULT_INTEGRATOR = scipy.integrate.DOP853
 
+# Solvers that can continue integration beyond their original time boundary
+# by simply updating it
+EXTENSIBLE_SOLVERS = (
+    scipy.integrate.RK23,
+    scipy.integrate.RK45,
+    scipy.integrate.DOP853,
+)
+
+# Solvers that make use of the jacobian of the state derivative and accept it
+# as a constant matrix
+JACOBIAN_SOLVERS = (
+    scipy.integrate.BDF,
+    scipy.integrate.Radau,
+)
+
 
 class SimulationError(RuntimeError):
     """Exception raised when an error occurs during simulation"""
@@ -42,9 +58,16 @@ class SimulationResult(Sequence):
 
     def __init__(self, system: System, source=None):
         self.system = system
-        self._t = np.empty(INITIAL_RESULT_SIZE)
-        self._inputs = np.empty((self.system.num_inputs, INITIAL_RESULT_SIZE))
-        self._state = np.empty((self.system.num_states, INITIAL_RESULT_SIZE))
+
+        # All samples are stored in a single buffer, with one row per sample
+        # consisting of time, inputs and state. The properties provide views
+        # of the respective columns.
+        self._inputs_slice = slice(1, 1 + self.system.num_inputs)
+        self._state_slice = slice(
+            self._inputs_slice.stop,
+            self._inputs_slice.stop + self.system.num_states,
+        )
+        self._buffer = np.empty((INITIAL_RESULT_SIZE, self._state_slice.stop))
 
         self.current_idx = 0
 
@@ -54,17 +77,17 @@ class SimulationResult(Sequence):
     @property
     def time(self):
         """The time vector of the simulation result"""
-        return self._t[0 : self.current_idx]
+        return self._buffer[0 : self.current_idx, 0]
 
     @property
     def inputs(self):
         """The input vector of the simulation result"""
-        return self._inputs[:, 0 : self.current_idx]
+        return self._buffer[0 : self.current_idx, self._inputs_slice].T
 
     @property
     def state(self):
         """The state vector of the simulation result"""
-        return self._state[:, 0 : self.current_idx]
+        return self._buffer[0 : self.current_idx, self._state_slice].T
 
     def collect_from(self, source):
         """Collect data points from the given source
@@ -78,10 +101,39 @@ class SimulationResult(Sequence):
     def append(self, system_state):
         """Append an entry to the result vectors.
 
+        If the system state represents multiple samples, all of them are
+        appended at once.
+
         Args:
             system_state: The system state to append
         """
-        self._append(system_state.time, system_state.inputs, system_state.state)
+        if np.ndim(system_state.time) > 0:
+            self._append_samples(
+                system_state.time, system_state.inputs, system_state.state
+            )
+        else:
+            self._append(
+                system_state.time, system_state.inputs, system_state.state
+            )
+
+    def _append_samples(self, time, inputs, state):
+        """Append multiple entries to the result vectors.
+
+        Args:
+          time: The vector of time tags for the entries
+          inputs: The matrix of input vectors, with one column per entry
+          state: The matrix of state vectors, with one column per entry
+        """
+
+        count = len(time)
+        if self.current_idx + count > self._buffer.shape[0]:
+            self.extend_space(self.current_idx + count)
+        rows = self._buffer[self.current_idx : self.current_idx + count]
+        rows[:, 0] = time
+        rows[:, self._inputs_slice] = np.transpose(inputs)
+        rows[:, self._state_slice] = np.transpose(state)
+
+        self.current_idx += count
 
     def _append(self, time, inputs, state):
         """Append an entry to the result vectors.
@@ -92,25 +144,35 @@ class SimulationResult(Sequence):
           state: The state vector
         """
 
-        if self.current_idx >= self._t.size:
+        if self.current_idx >= self._buffer.shape[0]:
             self.extend_space()
-        self._t[self.current_idx] = time
-        self._inputs[:, self.current_idx] = inputs
-        self._state[:, self.current_idx] = state
+        row = self._buffer[self.current_idx]
+        row[0] = time
+        row[self._inputs_slice] = inputs
+        row[self._state_slice] = state
 
         self.current_idx += 1
 
-    def extend_space(self):
-        """Extend the storage space for the vectors"""
-        self._t = np.r_[self._t, np.empty(RESULT_SIZE_EXTENSION)]
-        self._inputs = np.c_[
-            self._inputs,
-            np.empty((self.system.num_inputs, RESULT_SIZE_EXTENSION)),
-        ]
-        self._state = np.c_[
-            self._state,
-            np.empty((self.system.num_states, RESULT_SIZE_EXTENSION)),
-        ]
+    def extend_space(self, min_size=0):
+        """Extend the storage space for the vectors
+
+        The storage space grows geometrically by ``RESULT_SIZE_GROWTH_FACTOR``,
+        but at least by ``RESULT_SIZE_EXTENSION`` entries, so that the total
+        effort for copying the existing entries stays linear in the number of
+        entries.
+
+        Args:
+            min_size: The minimum number of entries to provide space for
+        """
+        size = self._buffer.shape[0]
+        new_size = max(
+            int(size * RESULT_SIZE_GROWTH_FACTOR),
+            size + RESULT_SIZE_EXTENSION,
+            min_size,
+        )
+        new_buffer = np.empty((new_size, self._buffer.shape[1]))
+        new_buffer[: self.current_idx] = self._buffer[: self.current_idx]
+        self._buffer = new_buffer
 
     def get_state_value(self, state: State):
         """Determine the value of the given state in this result object"""
@@ -164,8 +226,14 @@ class SimpleEventDetector:
         max_subdiv: The maximum number of subdivisions for a given time
             interval.
         min_subdiv_length: The minimum length of a subdivision.
+        root_finder: The method for localizing the zero-crossings, either
+            ``"illinois"`` for the Illinois variant of the false position
+            method, falling back to bisection where the interpolation fails,
+            or ``"bisection"`` for pure bisection (default: ``"illinois"``).
     """
 
+    ROOT_FINDERS = ("illinois", "bisection")
+
     def __init__(
         self,
         system,
@@ -174,16 +242,24 @@ class SimpleEventDetector:
         maxiter=1000,
         max_subdiv=5,
         min_subdiv_length=1e-3,
+        root_finder="illinois",
     ):
+        if root_finder not in self.ROOT_FINDERS:
+            raise ValueError("Unknown root finder %s" % root_finder)
         self.system = system
         self.events = events
         self.xtol = xtol
         self.maxiter = maxiter
         self.max_subdiv = max_subdiv
         self.min_subdiv_length = min_subdiv_length
+        self.root_finder = root_finder
         self.event_tolerances = np.array([event.tolerance for event in events])
         self.event_directions = np.array([event.direction for event in events])
 
+        # Time, state, inputs and event values of the last sample of the most
+        # recent call to `localize_events`
+        self._last_sample = None
+
     def localize_first_event(self, start_time, end_time, state, inputs):
         """Localize the first event occurring in the given time frame.
 
@@ -234,6 +310,10 @@ class SimpleEventDetector:
             each event having occurred in the given time frame.
         """
 
+        if len(self.events) == 0:
+            # Without events, there is nothing to localize
+            return []
+
         # Determine the number of subdivisions to create
         time_length = end_time - start_time
         subdivision_count = min(
@@ -245,47 +325,128 @@ class SimpleEventDetector:
         )
 
         # Get the values of the event functions at these points
-        states = SystemState(
-            system=self.system,
-            time=sample_times,
-            state=state(sample_times),
-            inputs=inputs(sample_times),
-        )
-        event_values = np.array([event(states) for event in self.events])
+        event_values = self._sample_event_values(sample_times, state, inputs)
 
-        # Determine the location of the event values relative to the boundaries
-        positive = event_values.T > self.event_tolerances
-        negative = event_values.T < -self.event_tolerances
+        # Determine the changes of the location of the event values relative to
+        # the tolerance band between subsequent samples
+        region_changes = np.diff(
+            _event_regions(event_values, self.event_tolerances[:, np.newaxis]),
+            axis=1,
+        )
+        mask = _matches_direction(
+            region_changes, self.event_directions[:, np.newaxis]
+        )
 
-        up = (negative[:-1] & ~negative[1:]) | (~positive[:-1] & positive[1:])
-        down = (~negative[:-1] & negative[1:]) | (positive[:-1] & ~positive[1:])
-        mask = np.transpose(
-            (up & (self.event_directions >= 0))
-            | (down & (self.event_directions <= 0))
+        # Localize the zero-crossings of all active events at once
+        event_indices, time_indices = np.nonzero(mask)
+        event_times = self._find_event_times(
+            event_indices,
+            sample_times[time_indices],
+            sample_times[time_indices + 1],
+            event_values[event_indices, time_indices],
+            event_values[event_indices, time_indices + 1],
+            state,
+            inputs,
         )
+        return [
+            (event_time, self.events[event_idx])
+            for event_time, event_idx in zip(event_times, event_indices)
+        ]
 
-        # For each of the active events, localize the zero-crossing
-        locations = list()
-        for idx, event in enumerate(self.events):
-            for time_idx, flag in enumerate(mask[idx]):
-                if flag:
-                    event_time = self._find_event_time(
-                        event,
-                        sample_times[time_idx],
-                        sample_times[time_idx + 1],
-                        state,
-                        inputs,
-                    )
-                    locations.append((event_time, event))
-        return locations
+    def _sample_event_values(self, sample_times, state, inputs):
+        """Determine the values of the events at the given sampling times.
+
+        Usually, the first sample is the last sample of the previous call, as
+        integration continues from there. In that case, the event values of
+        that sample are re-used, unless the state or the inputs have changed.
+
+        Args:
+            sample_times: The sampling times
+            state:
+                A callable, with `state(t)` being the state vector at time `t`
+                for any one-dimensional array `t` of sampling times.
+            inputs:
+                A callable, with `state(t)` being the input vector at time `t`
+                for any one-dimensional array `t` of sampling times.
 
-    def _find_event_time(self, event, start_time, end_time, state, inputs):
+        Returns:
+            An array of event values, with one row per event and one column
+            per sample
         """
-        Find the time when the sign change occurs.
+
+        sample_states = state(sample_times)
+        sample_inputs = inputs(sample_times)
+        # The inputs may be given as a single vector for all samples
+        sampled_inputs = np.ndim(sample_inputs) == 2
+
+        last_sample = self._last_sample
+        if (
+            last_sample is not None
+            and len(sample_times) > 1
+            and last_sample[0] == sample_times[0]
+            and np.array_equal(last_sample[1], sample_states[:, 0])
+            and np.array_equal(
+                last_sample[2],
+                sample_inputs[:, 0] if sampled_inputs else sample_inputs,
+            )
+        ):
+            first_values = last_sample[3][:, np.newaxis]
+            sample_times = sample_times[1:]
+            sample_states = sample_states[:, 1:]
+            if sampled_inputs:
+                sample_inputs = sample_inputs[:, 1:]
+        else:
+            first_values = None
+
+        system_state = SystemState(
+            system=self.system,
+            time=sample_times,
+            state=sample_states,
+            inputs=sample_inputs,
+        )
+        event_values = np.array([event(system_state) for event in self.events])
+        if first_values is not None:
+            event_values = np.concatenate((first_values, event_values), axis=1)
+
+        self._last_sample = (
+            sample_times[-1],
+            sample_states[:, -1].copy(),
+            np.copy(sample_inputs[:, -1] if sampled_inputs else sample_inputs),
+            event_values[:, -1].copy(),
+        )
+        return event_values
+
+    def _find_event_times(
+        self,
+        event_indices,
+        start_times,
+        end_times,
+        start_values,
+        end_values,
+        state,
+        inputs,
+    ):
+        """
+        Find the times when the sign changes occur for a set of events and
+        time intervals.
+
+        The search is performed for all events and intervals simultaneously,
+        so that the state and the event functions are evaluated only once per
+        iteration for all of them.
+
+        Each iteration splits the interval at the zero of the secant through
+        the values at its ends, falling back to bisection where that point is
+        not inside the interval. Following the Illinois method, if the same
+        end is replaced twice in a row, the value at the other end is halved
+        to ensure that both ends converge. If the root finder is set to
+        ``"bisection"``, the intervals are always bisected.
 
         Args:
-            start_time: The start time of the time frame.
-            end_time: The end time of the time_frame.
+            event_indices: The indices of the events to localize
+            start_times: The start times of the time frames.
+            end_times: The end times of the time_frames.
+            start_values: The values of the events at the start times.
+            end_values: The values of the events at the end times.
             state:
                 A callable, with `state(t)` being the state vector at time `t`
                 for any scalar or one-dimensional array `t` with
@@ -295,49 +456,106 @@ class SimpleEventDetector:
                 for any scalar or one-dimensional array `t` with
                 `start_time <= t <= end_time`.
         Returns:
-            A time at or after the sign change occurs
+            An array of times at or after the respective sign change occurs
         """
 
-        assert start_time <= end_time
+        assert np.all(start_times <= end_times)
 
-        start_state = SystemState(
-            system=self.system,
-            time=start_time,
-            state=state(start_time),
-            inputs=inputs(start_time),
+        # Each event is evaluated only once per iteration for all the samples,
+        # so we determine the events involved and for each sample the row of
+        # the respective event in the array of event values.
+        unique_indices, value_rows = np.unique(
+            event_indices, return_inverse=True
         )
-        end_state = SystemState(
-            system=self.system,
-            time=end_time,
-            state=state(end_time),
-            inputs=inputs(end_time),
+        events = [self.events[event_idx] for event_idx in unique_indices]
+        value_columns = np.arange(len(event_indices))
+        tolerances = self.event_tolerances[event_indices]
+        end_signs = _event_regions(end_values, tolerances)
+        # Values within the tolerance are considered to be zero, so the point
+        # we are looking for is where the event function enters the region of
+        # the end value, i.e. where it leaves the tolerance band towards the
+        # end value or, if the end value is within the tolerance band, where
+        # it enters the band. That way, integration resumes beyond the whole
+        # tolerance band, and the same crossing is not detected again. For
+        # interpolation, we shift the values so that this point becomes the
+        # zero.
+        offsets = (
+            np.where(
+                end_signs != 0,
+                end_signs,
+                _event_regions(start_values, tolerances),
+            )
+            * tolerances
         )
-
-        start_value = event(start_state)
-        end_value = event(end_state)
-
-        assert (
-            (start_value < -event.tolerance) ^ (end_value < -event.tolerance)
-        ) | ((event.tolerance < start_value) ^ (event.tolerance < end_value))
+        start_values = start_values - offsets
+        end_values = end_values - offsets
+        bisection = self.root_finder == "bisection"
+        # The end replaced in the previous iteration (-1: start, 1: end)
+        last_replaced = np.zeros(len(event_indices))
 
         iter_count = 0
-        time_diff = end_time - start_time
-        while iter_count < self.maxiter and time_diff > self.xtol:
-            time_diff /= 2
-            mid_time = start_time + time_diff
+        active = (end_times - start_times) > self.xtol
+        while iter_count < self.maxiter and np.any(active):
+            mid_times = _bisect_or_interpolate(
+                start_times, end_times, start_values, end_values, bisection
+            )
             mid_state = SystemState(
                 system=self.system,
-                time=mid_time,
-                state=state(mid_time),
-                inputs=inputs(mid_time),
+                time=mid_times,
+                state=state(mid_times),
+                inputs=inputs(mid_times),
             )
-            mid_value = event(mid_state)
-            mid_value = 0 if np.abs(mid_value) < event.tolerance else mid_value
-            if np.sign(mid_value) == np.sign(start_value):
-                # The sign change happens after mid_time
-                start_time = mid_time
+            event_values = np.array([event(mid_state) for event in events])
+            mid_values = event_values[value_rows, value_columns]
+            mid_signs = _event_regions(mid_values, tolerances)
+            mid_values -= offsets
+            # Where the region of the end value is entered after mid_time, we
+            # continue with the upper part of the interval, and otherwise with
+            # the lower part
+            upper = active & (mid_signs != end_signs)
+            lower = active & ~upper
+            start_times[upper] = mid_times[upper]
+            start_values[upper] = mid_values[upper]
+            end_times[lower] = mid_times[lower]
+            end_values[lower] = mid_values[lower]
+            # Illinois modification
+            end_values[upper & (last_replaced == -1)] /= 2
+            start_values[lower & (last_replaced == 1)] /= 2
+            last_replaced[upper] = -1
+            last_replaced[lower] = 1
+
+            active = (end_times - start_times) > self.xtol
             iter_count += 1
-        return start_time
+        return end_times
+
+
+def _bisect_or_interpolate(
+    start_times, end_times, start_values, end_values, bisection
+):
+    """Determine the points at which to split a set of intervals.
+
+    Args:
+        start_times: The start times of the intervals
+        end_times: The end times of the intervals
+        start_values: The values of the functions at the start times
+        end_values: The values of the functions at the end times
+        bisection: Flag indicating whether to always bisect the intervals
+
+    Returns:
+        The array of split points, which are either the zeros of the secants,
+        or the midpoints of the intervals if the zeros are not strictly inside
+        the intervals
+    """
+
+    mid_times = start_times + (end_times - start_times) / 2
+    if bisection:
+        return mid_times
+    with np.errstate(divide="ignore", invalid="ignore"):
+        secant_times = end_times - end_values * (end_times - start_times) / (
+            end_values - start_values
+        )
+    inside = (start_times < secant_times) & (secant_times < end_times)
+    return np.where(inside, secant_times, mid_times)
 
 
 class Simulator:
@@ -370,7 +588,10 @@ class Simulator:
             The default is the :class:`DOP853 <scipy.integrate.DOP853>`
             solver.
         solver_options:
-            Options to be passed to the solver constructor.
+            Options to be passed to the solver constructor. If the state
+            derivative of the system is affine, the constant jacobian is
+            passed to the :class:`BDF <scipy.integrate.BDF>` and
+            :class:`Radau <scipy.integrate.Radau>` solvers, unless given here.
         event_detector:
             Constructor for an event detector implementation. See
             :class:`SimpleEventDetector` for more information.
@@ -426,12 +647,75 @@ class Simulator:
             [event.direction for event in self.system.events]
         )
 
-        # Check if we have continuous-time states
-        self.have_continuous_time_states = any(
-            state.derivative_function is not None
+        # Collect the index ranges and derivative functions of the
+        # continuous-time states. For scalar states, the value of the
+        # derivative can be assigned directly, so these are marked as not
+        # requiring flattening.
+        self._derivative_functions = [
+            (state.state_slice, state.derivative_function, state.shape != ())
             for state in self.system.states
+            if state.derivative_function is not None
+        ]
+
+        # Check if we have continuous-time states
+        self.have_continuous_time_states = len(self._derivative_functions) > 0
+
+        # The system state used for evaluating the state derivative
+        self._derivative_state = _ReusableSystemState(
+            system=self.system,
+            time=self.current_time,
+            state=self.current_state,
+            inputs=self.current_inputs,
+        )
+
+        # If the derivatives of all continuous-time states are affine
+        # functions of the respective state alone, the state derivative of
+        # the whole system can be determined by a single matrix product.
+        self._affine_dynamics = self._get_affine_dynamics()
+        if self._affine_dynamics is not None:
+            self._state_derivative_function = self._affine_state_derivative
+        else:
+            self._state_derivative_function = self._create_state_derivative()
+
+        # In the affine case, the jacobian of the state derivative is the
+        # constant system matrix. Solvers using the jacobian would otherwise
+        # approximate it by repeatedly evaluating the state derivative.
+        if (
+            self._affine_dynamics is not None
+            and "jac" not in self.solver_options
+            and isinstance(self.solver_method, type)
+            and issubclass(self.solver_method, JACOBIAN_SOLVERS)
+        ):
+            self.solver_options = dict(
+                self.solver_options, jac=self._affine_dynamics[0]
+            )
+
+        # Split events into two partitions:
+        # - terminating events
+        # - non-terminating events
+        # We will handle them separately during simulation. The detectors are
+        # re-used for all calls to `run_until`.
+        terminating_events = [
+            event for event in self.system.events if len(event.listeners) > 0
+        ]
+        non_terminating_events = [
+            event for event in self.system.events if len(event.listeners) == 0
+        ]
+        self._terminating_detector = self.event_detector(
+            system=self.system,
+            events=terminating_events,
+            **self.event_detector_options
+        )
+        self._non_terminating_detector = self.event_detector(
+            system=self.system,
+            events=non_terminating_events,
+            **self.event_detector_options
         )
 
+        # The solver of the last integration, which may be continued if the
+        # state has not been changed since
+        self._solver = None
+
         # Create the clock queue
         self.clock_queue = ClockQueue(
             start_time=start_time, clocks=self.system.clocks
@@ -480,27 +764,14 @@ class Simulator:
         # Events leading to state changes will invalidate the solver, so
         # a new one will have to be created. However, we'll run as long as
         # possible on a single solver to save instantiation time
+        terminating_detector = self._terminating_detector
+        non_terminating_detector = self._non_terminating_detector
+        have_events = self.system.num_events > 0
 
-        # Split events into two partitions:
-        # - terminating events
-        # - non-terminating events
-        # We will handle them separately later.
-        terminating_events = [
-            event for event in self.system.events if len(event.listeners) > 0
-        ]
-        non_terminating_events = [
-            event for event in self.system.events if len(event.listeners) == 0
-        ]
-        terminating_detector = self.event_detector(
-            system=self.system,
-            events=terminating_events,
-            **self.event_detector_options
-        )
-        non_terminating_detector = self.event_detector(
-            system=self.system,
-            events=non_terminating_events,
-            **self.event_detector_options
-        )
+        # The inputs do not change during integration, so their interpolation
+        # always provides the current inputs
+        def _input_interpolator(_t):
+            return self.current_inputs
 
         while self.current_time < time_boundary:
             terminated = False
@@ -511,15 +782,23 @@ class Simulator:
             if solver_bound is None or solver_bound > time_boundary:
                 solver_bound = time_boundary
 
-            # Create the solver
-            solver = self.solver_method(
-                fun=self._state_derivative,
-                t0=self.current_time,
-                y0=self.current_state,
-                t_bound=solver_bound,
-                vectorized=True,
-                **self.solver_options
-            )
+            # Continue with the previous solver if possible, as this
+            # preserves its step size, or create a new solver.
+            # The state derivative is not declared as vectorized, so that it is
+            # always called with flat state vectors. Otherwise, the solver would
+            # pass each state as a column matrix, which prevents the use of
+            # the faster evaluation paths for vectors.
+            solver = self._continue_solver(solver_bound)
+            if solver is None:
+                solver = self.solver_method(
+                    fun=self._state_derivative_function,
+                    t0=self.current_time,
+                    y0=self.current_state,
+                    t_bound=solver_bound,
+                    vectorized=False,
+                    **self._get_restart_options(solver_bound)
+                )
+                self._solver = solver
 
             # Run the integration until the determined time limit
             while self.current_time < solver_bound and not terminated:
@@ -536,46 +815,54 @@ class Simulator:
                 if msg is not None:
                     raise IntegrationError(msg)
 
-                # Get interpolation functions for state and inputs
-                state_interpolator = solver.dense_output()
-
-                def _input_interpolator(_t):
-                    return self.current_inputs
-
-                # Check for occurrence of a terminating event and determine the
-                # time of the earliest terminating event.
-                first_term = terminating_detector.localize_first_event(
-                    start_time=self.current_time,
-                    end_time=solver.t,
-                    state=state_interpolator,
-                    inputs=_input_interpolator,
-                )
-                search_end_time = solver.t
-
-                # Restrict the search time for non-terminating events
-                if first_term is not None:
-                    assert first_term[0] >= self.current_time
-                    search_end_time = first_term[0]
-
-                # Find non-terminating events
-                non_term_occs = non_terminating_detector.localize_events(
-                    start_time=self.current_time,
-                    end_time=search_end_time,
-                    state=state_interpolator,
-                    inputs=_input_interpolator,
-                )
+                # Without any events, there is nothing to localize, so we skip
+                # the event detectors and avoid the additional evaluations of
+                # the state derivative that the solver may need for providing
+                # the dense output.
+                if have_events:
+                    # Get interpolation functions for state and inputs.
+                    state_interpolator = solver.dense_output()
+
+                    # Check for occurrence of a terminating event and determine
+                    # the time of the earliest terminating event.
+                    first_term = terminating_detector.localize_first_event(
+                        start_time=self.current_time,
+                        end_time=solver.t,
+                        state=state_interpolator,
+                        inputs=_input_interpolator,
+                    )
+                    search_end_time = solver.t
+
+                    # Restrict the search time for non-terminating events
+                    if first_term is not None:
+                        assert first_term[0] >= self.current_time
+                        search_end_time = first_term[0]
+
+                    # Find non-terminating events
+                    non_term_occs = non_terminating_detector.localize_events(
+                        start_time=self.current_time,
+                        end_time=search_end_time,
+                        state=state_interpolator,
+                        inputs=_input_interpolator,
+                    )
+                else:
+                    first_term = None
+                    non_term_occs = []
 
                 # Yield intermediate states for non-terminating events in the
-                # order in which they occur
+                # order in which they occur. The states at these times are
+                # interpolated all at once.
                 non_term_occs.sort(key=lambda v: v[0])
-                for time, event in non_term_occs:
-                    event_state = SystemState(
-                        system=self.system,
-                        time=time,
-                        state=state_interpolator(time),
-                        inputs=_input_interpolator(time),
-                    )
-                    yield event_state
+                if len(non_term_occs) > 0:
+                    event_times = np.array([time for time, _ in non_term_occs])
+                    event_states = state_interpolator(event_times)
+                    for idx, time in enumerate(event_times):
+                        yield SystemState(
+                            system=self.system,
+                            time=time,
+                            state=event_states[:, idx],
+                            inputs=_input_interpolator(time),
+                        )
 
                 # In case of a terminating event, advance time to the time of
                 # the event and execute its handlers.
@@ -599,6 +886,64 @@ class Simulator:
             # limit, so we execute all pending clock ticks now.
             self._run_clock_ticks()
 
+    def _continue_solver(self, solver_bound):
+        """Prepare the solver of the last integration to continue up to the
+        given time boundary, if possible.
+
+        This is only possible if the solver supports extending its time
+        boundary and if it has integrated up to the current time and state,
+        i.e., no terminating event occurred and neither clock ticks nor event
+        listeners have changed the state since.
+
+        Args:
+            solver_bound: The new time boundary for the solver
+
+        Returns:
+            The solver, or ``None`` if a new solver must be created
+        """
+
+        solver = self._solver
+        if (
+            not isinstance(solver, EXTENSIBLE_SOLVERS)
+            or solver.t != self.current_time
+            or not np.array_equal(solver.y, self.current_state)
+        ):
+            return None
+        solver.t_bound = solver_bound
+        solver.status = "running"
+        return solver
+
+    def _get_restart_options(self, solver_bound):
+        """Determine the options for creating a new solver up to the given
+        time boundary.
+
+        If the previous solver was a Runge-Kutta solver of the same type, the
+        new solver starts with the step size the previous solver would have
+        used for its next step. This avoids the evaluations of the state
+        derivative for selecting the initial step size, and the new solver
+        does not need to grow its step size from a small initial value again.
+        Should the step size be too large after a change of the state, the
+        solver will reduce it as usual.
+
+        Args:
+            solver_bound: The time boundary for the new solver
+
+        Returns:
+            The keyword arguments to pass to the solver constructor
+        """
+
+        solver = self._solver
+        if (
+            "first_step" in self.solver_options
+            or not isinstance(solver, EXTENSIBLE_SOLVERS)
+            # Subclasses may step differently, so the class must match exactly
+            or solver.__class__ is not self.solver_method
+            or solver.h_abs <= 0
+        ):
+            return self.solver_options
+        first_step = min(solver.h_abs, solver_bound - self.current_time)
+        return dict(self.solver_options, first_step=first_step)
+
     def _run_discrete_model_simulation(self, time_boundary):
         # For discrete-only systems we only need to run the clocks and advance
         # the time accordingly until we reach the time boundary.
@@ -651,8 +996,17 @@ class Simulator:
             )
 
             # Determine the values of all event functions before running the
-            # event listeners.
-            last_event_values = self.system.event_values(state_updater)
+            # event listeners. The state updater does not cache signal values,
+            # so we evaluate them on a separate system state, allowing the
+            # event functions to share the values of common signals.
+            last_event_values = self.system.event_values(
+                SystemState(
+                    system=self.system,
+                    time=self.current_time,
+                    state=self.current_state,
+                    inputs=self.current_inputs,
+                )
+            )
 
             # Collect all listeners associated with the events
             # Note that we run each listener only once, even if it is associated
@@ -676,7 +1030,14 @@ class Simulator:
 
             # Determine the value of event functions after running the event
             # listeners
-            new_event_values = self.system.event_values(state_updater)
+            new_event_values = self.system.event_values(
+                SystemState(
+                    system=self.system,
+                    time=self.current_time,
+                    state=self.current_state,
+                    inputs=self.current_inputs,
+                )
+            )
 
             # Determine which events occurred as a result of the changed state
             event_mask = _find_active_events(
@@ -685,18 +1046,79 @@ class Simulator:
                 tolerances=self.event_tolerances,
                 directions=self.event_directions,
             )
-            if any(event_mask):
-                event_sources = [
-                    event
-                    for event, flag in zip(self.system.events, event_mask)
-                    if flag
-                ]
-            else:
-                event_sources = []
+            event_sources = [
+                self.system.events[event_idx]
+                for event_idx in np.flatnonzero(event_mask)
+            ]
+
+    def _create_state_derivative(self):
+        """Create the state derivative function used for integrating the state
+        over time.
+
+        Returns:
+          The state derivative function, accepting time and state vector and
+          returning the time-derivative of the state vector
+        """
+
+        # The same system state is re-used for all calls, only replacing time,
+        # state and inputs.
+        system_state = self._derivative_state
+        reset_system_state = system_state.reset
+        derivative_functions = tuple(self._derivative_functions)
+        num_states = self.system.num_states
+        zeros = np.zeros
+        ravel = np.ravel
+
+        def _state_derivative(time, state):
+            # The inputs are passed explicitly, as otherwise the initial inputs
+            # would be used.
+            reset_system_state(time, state, self.current_inputs)
+            # The solver may keep the derivative, so it must not be re-used
+            state_derivative = zeros(num_states)
+            for state_slice, function, flatten in derivative_functions:
+                derivative = function(system_state)
+                if flatten:
+                    derivative = ravel(derivative)
+                state_derivative[state_slice] = derivative
+            return state_derivative
+
+        return _state_derivative
+
+    def _get_affine_dynamics(self):
+        """Determine the state derivative of the system as an affine function
+        of the state vector.
+
+        Returns:
+            A tuple ``(matrix, offset)`` with the state derivative being given
+            by ``matrix @ state + offset``, or ``None`` if the derivative of
+            any of the continuous-time states is not known to be affine
+        """
 
-    def _state_derivative(self, time, state):
+        system_state = SystemState(
+            system=self.system,
+            time=self.current_time,
+            state=self.current_state,
+            inputs=self.current_inputs,
+        )
+        num_states = self.system.num_states
+        matrix = np.zeros((num_states, num_states))
+        offset = np.zeros(num_states)
+        for state in self.system.states:
+            if state.derivative_function is None:
+                continue
+            if state.affine_dynamics is None:
+                return None
+            dynamics = state.affine_dynamics(system_state)
+            if dynamics is None:
+                return None
+            state_matrix, state_offset = dynamics
+            matrix[state.state_slice, state.state_slice] = state_matrix
+            offset[state.state_slice] = np.ravel(state_offset)
+        return matrix, offset
+
+    def _affine_state_derivative(self, time, state):
         """The state derivative function used for integrating the state over
-        time.
+        time if the state derivative is an affine function of the state.
 
         Args:
           time: The current time
@@ -706,11 +1128,37 @@ class Simulator:
           The time-derivative of the state vector
         """
 
-        system_state = SystemState(system=self.system, time=time, state=state)
-        state_derivative = self.system.state_derivative(system_state)
+        del time  # unused
+        matrix, offset = self._affine_dynamics
+        state_derivative = np.dot(matrix, state)
+        state_derivative += offset
         return state_derivative
 
 
+class _ReusableSystemState(SystemState):
+    """A ``_ReusableSystemState`` is a system state that can be re-used for
+    evaluations at different times, avoiding the creation of a new system state
+    for each evaluation."""
+
+    def reset(self, time, state, inputs):
+        """Replace time, state and inputs of this system state, discarding all
+        cached values.
+
+        Args:
+            time: The new time
+            state: The new state vector
+            inputs: The new input vector
+        """
+
+        self.time = time
+        self.state = state
+        self.inputs = inputs
+        self._multi_sample = not np.isscalar(time)
+        self._signal_values.clear()
+        self._state_values.clear()
+        self._input_values.clear()
+
+
 class _SystemStateUpdater(SystemState):
     """A ``_SystemStateUpdater`` is a system state in which the states can be
     updated"""
@@ -720,10 +1168,23 @@ class _SystemStateUpdater(SystemState):
         # Make a copy of the state
         self.state = self.state.copy()
 
+    def get_signal_value(self, signal):
+        """Determine the value of the given signal.
+
+        As listeners may modify the state, signal values are not cached here.
+        """
+
+        return signal.value(self)
+
     def set_state_value(self, state: State, value):
         """Update the value of the given state"""
 
-        self.state[state.state_slice] = np.asarray(value).ravel()
+        # Scalars and vectors can be assigned directly, only values of states
+        # with more dimensions must be flattened.
+        if np.ndim(value) <= 1:
+            self.state[state.state_slice] = value
+        else:
+            self.state[state.state_slice] = np.ravel(value)
 
     def __setitem__(self, key, value):
         warnings.warn(
@@ -752,11 +1213,40 @@ def _find_active_events(start_values, end_values, tolerances, directions):
         sign change or not.
     """
 
-    up = ((start_values < -tolerances) & (end_values >= -tolerances)) | (
-        (start_values <= tolerances) & (end_values > tolerances)
-    )
-    down = ((start_values >= -tolerances) & (end_values < -tolerances)) | (
-        (start_values > tolerances) & (end_values <= tolerances)
+    region_changes = _event_regions(end_values, tolerances) - _event_regions(
+        start_values, tolerances
     )
-    mask = (up & (directions >= 0)) | (down & (directions <= 0))
-    return mask
+    return _matches_direction(region_changes, directions)
+
+
+def _event_regions(values, tolerances):
+    """Determine the location of event values relative to the tolerance band.
+
+    Args:
+        values: The event values
+        tolerances: The tolerances of the events
+
+    Returns:
+        An array of integers, which are -1 for values below the tolerance band,
+        1 for values above the tolerance band, and 0 for values within it.
+    """
+
+    return (values > tolerances).astype(np.int8) - (values < -tolerances)
+
+
+def _matches_direction(region_changes, directions):
+    """Determine whether changes of the event regions represent sign changes
+    in the direction of the respective event.
+
+    Args:
+        region_changes: The differences of the event regions
+        directions: The directions of the events
+
+    Returns:
+        An array of booleans, indicating whether the region has changed in a
+        direction matching that of the event.
+    """
+
+    # A direction of zero matches all changes, while other directions match
+    # changes of the same sign.
+    return (region_changes != 0) & (region_changes * directions >= 0)
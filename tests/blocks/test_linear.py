@@ -1,6 +1,7 @@
 # pylint: disable=missing-module-docstring
 import numpy as np
 import pytest
+from scipy.integrate import BDF, Radau
 from modypy.blocks.linear import (
     Gain,
     InvalidLTIException,
@@ -10,7 +11,8 @@ from modypy.blocks.linear import (
     sum_signal,
 )
 from modypy.blocks.sources import constant
-from modypy.model import InputSignal, Signal, System, SystemState
+from modypy.model import InputSignal, Signal, State, System, SystemState
+from modypy.simulation import SimulationResult, Simulator
 from numpy import testing as npt
 
 
@@ -20,6 +22,39 @@ def _make_array_or_scalar(shape):
     return np.empty(shape=shape)
 
 
+def _overdamped_oscillator(
+    parent, feed_through_matrix=0, initial_condition=None, dtype=np.float64
+):
+    """Create an LTI block of an overdamped oscillator with poles at -1 and
+    -2, with the position as output."""
+
+    return LTISystem(
+        parent=parent,
+        system_matrix=[[0, 1], [-2, -3]],
+        input_matrix=[[0], [1]],
+        output_matrix=[[1, 0]],
+        feed_through_matrix=[[feed_through_matrix]],
+        initial_condition=initial_condition,
+        dtype=dtype,
+    )
+
+
+def _first_order_lag(parent, lti_class=LTISystem):
+    """Create an LTI block of a first-order lag with time constant 1,
+    initial value 1 and zero input."""
+
+    lag = lti_class(
+        parent=parent,
+        system_matrix=-1,
+        input_matrix=1,
+        output_matrix=1,
+        feed_through_matrix=0,
+        initial_condition=1.0,
+    )
+    lag.input.connect(constant(value=0.0))
+    return lag
+
+
 @pytest.mark.parametrize(
     "input_shape,system_shape,output_shape,feed_through_shape",
     [
@@ -85,6 +120,146 @@ def test_invalid_lti_configurations(
         )
 
 
+def test_lti_evaluation():
+    """Test the evaluation of state derivative and output of an LTI"""
+
+    system = System()
+    lti = _overdamped_oscillator(
+        system, feed_through_matrix=2, initial_condition=[1, 2]
+    )
+    source = InputSignal(system, shape=1, value=[4])
+    lti.input.connect(source)
+
+    # The matrices are stored as contiguous float arrays
+    assert lti.system_matrix.dtype == np.float64
+    assert lti.system_matrix.flags.c_contiguous
+
+    system_state = SystemState(time=0, system=system)
+    npt.assert_almost_equal(lti.state_derivative(system_state), [2, -4])
+    npt.assert_almost_equal(lti.output(system_state), [9])
+
+    # Evaluation must also work for multiple samples at once
+    system_state = SystemState(
+        time=np.r_[0, 1],
+        system=system,
+        state=np.array([[1, 0], [2, 1]]),
+        inputs=np.array([[4, 0]]),
+    )
+    npt.assert_almost_equal(
+        lti.state_derivative(system_state), [[2, 1], [-4, -3]]
+    )
+    npt.assert_almost_equal(lti.output(system_state), [[9, 0]])
+
+
+def test_lti_single_precision():
+    """Test the evaluation of an LTI with single-precision matrices"""
+
+    system = System()
+    lti = _overdamped_oscillator(
+        system,
+        feed_through_matrix=2,
+        initial_condition=[1, 2],
+        dtype=np.float32,
+    )
+    source = InputSignal(system, shape=1, value=[4])
+    lti.input.connect(source)
+
+    assert lti.system_matrix.dtype == np.float32
+
+    system_state = SystemState(time=0, system=system)
+    derivative = lti.state_derivative(system_state)
+    assert derivative.dtype == np.float32
+    npt.assert_allclose(derivative, [2, -4], rtol=1e-6)
+    npt.assert_allclose(lti.output(system_state), [9], rtol=1e-6)
+
+
+def test_lti_affine_dynamics():
+    """Test the determination of the affine dynamics of an LTI"""
+
+    system = System()
+    lti = _overdamped_oscillator(system)
+    system_state = SystemState(time=0, system=system)
+
+    # A constant input leads to a constant offset
+    lti.input.connect(constant(value=[2]))
+    matrix, offset = lti.state.affine_dynamics(system_state)
+    npt.assert_equal(matrix, lti.system_matrix)
+    npt.assert_equal(offset, [0, 2])
+
+    # Other inputs may depend on the state
+    other_lti = LTISystem(
+        parent=system,
+        system_matrix=-1,
+        input_matrix=1,
+        output_matrix=1,
+        feed_through_matrix=0,
+    )
+    other_lti.input.connect(Signal(value=lambda data: 1))
+    assert other_lti.state.affine_dynamics(system_state) is None
+
+
+def test_lti_affine_dynamics_replaced_derivative():
+    """Test that the affine dynamics are not used if the state derivative
+    is not the one determined by the matrices"""
+
+    class ShiftedLTISystem(LTISystem):
+        """LTI system with shifted state derivative"""
+
+        def state_derivative(self, data):
+            return super().state_derivative(data) - 1.0
+
+    # Overridden state derivative
+    system = System()
+    lag = _first_order_lag(system, lti_class=ShiftedLTISystem)
+    simulator = Simulator(system, start_time=0)
+    result = SimulationResult(system, simulator.run_until(1.0))
+    npt.assert_allclose(lag.state(result)[-1], 2 * np.exp(-1) - 1, rtol=1e-6)
+
+    # Replaced derivative function
+    system = System()
+    lag = _first_order_lag(system)
+    lag.state.derivative_function = lambda data: 0.0
+    simulator = Simulator(system, start_time=0)
+    result = SimulationResult(system, simulator.run_until(1.0))
+    npt.assert_allclose(lag.state(result)[-1], 1.0)
+
+
+@pytest.mark.parametrize("solver_method", [BDF, Radau])
+def test_lti_state_jacobian(solver_method):
+    """Test the analytical jacobian of an LTI with implicit solvers"""
+
+    system = System()
+    State(system, derivative_function=lambda data: 1)
+    lti = _overdamped_oscillator(system)
+    lti.input.connect(constant(value=[2]))
+
+    jacobian = lti.state_jacobian
+    assert jacobian.shape == (system.num_states, system.num_states)
+    npt.assert_equal(
+        jacobian[lti.state.state_slice, lti.state.state_slice],
+        lti.system_matrix,
+    )
+    jacobian[lti.state.state_slice, lti.state.state_slice] = 0
+    npt.assert_equal(jacobian, 0)
+
+    simulator = Simulator(
+        system,
+        start_time=0,
+        solver_method=solver_method,
+        jac=lti.state_jacobian,
+        rtol=1e-8,
+        atol=1e-10,
+    )
+    result = SimulationResult(system, simulator.run_until(time_boundary=2.0))
+
+    # Step response of the oscillator
+    time = result.time
+    expected_position = 1 - 2 * np.exp(-time) + np.exp(-2 * time)
+    npt.assert_allclose(
+        lti.state(result)[0], expected_position, rtol=1e-5, atol=1e-6
+    )
+
+
 def test_gain_class():
     system = System()
     gain_block = Gain(system, k=[[1, 2], [3, 4]])
@@ -94,6 +269,23 @@ def test_gain_class():
     npt.assert_almost_equal(gain_block.output(None), [11, 25])
 
 
+def test_diagonal_gain_class():
+    system = System()
+    gain_block = Gain(system, k=[[2, 0], [0, 3]])
+    gain_in = InputSignal(system, shape=2, value=[3, 4])
+    gain_block.input.connect(gain_in)
+
+    system_state = SystemState(time=0, system=system)
+    npt.assert_almost_equal(gain_block.output(system_state), [6, 12])
+
+    system_state = SystemState(
+        time=np.r_[0, 1], system=system, inputs=np.array([[3, 5], [4, 6]])
+    )
+    npt.assert_almost_equal(
+        gain_block.output(system_state), [[6, 10], [12, 18]]
+    )
+
+
 def test_scalar_gain_function():
     gain_in = constant(value=[[3, 4], [5, 6]])
     gain_signal = gain(gain_matrix=3, input_signal=gain_in)
@@ -108,6 +300,17 @@ def test_gain_function():
     npt.assert_almost_equal(gain_signal(None), [11, 25])
 
 
+def test_diagonal_gain_function():
+    gain_in = constant(value=[3, 4])
+    gain_signal = gain(gain_matrix=[[2, 0], [0, 3]], input_signal=gain_in)
+
+    npt.assert_almost_equal(gain_signal(None), [6, 12])
+
+    # Shape mismatches must still be detected
+    with pytest.raises(ValueError):
+        gain(gain_matrix=np.eye(3), input_signal=gain_in)
+
+
 @pytest.mark.parametrize(
     "channel_weights, output_size, inputs, expected_output",
     [
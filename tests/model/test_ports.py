@@ -138,6 +138,26 @@ def test_port_access():
         unconnected_port(provider)
 
 
+def test_signal_value_caching():
+    """Test that the value of a signal is determined only once per system
+    state"""
+
+    system = System()
+    signal = Signal(value=Mock(return_value=1))
+    port = Port()
+    port.connect(signal)
+
+    system_state = SystemState(time=0, system=system)
+    assert signal(system_state) == 1
+    assert port(system_state) == 1
+    signal.value.assert_called_once_with(system_state)
+
+    # A new system state requires a new evaluation
+    other_system_state = SystemState(time=0, system=system)
+    signal(other_system_state)
+    assert signal.value.call_count == 2
+
+
 def test_port_not_connected_error():
     """Test the detection of unconnected ports"""
 
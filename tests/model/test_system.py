@@ -187,6 +187,49 @@ def test_multi_time_system_state():
     npt.assert_equal(system_state[input_2], ((1.0, 2.0, 3.0), (4.0, 5.0, 6.0)))
 
 
+def test_multi_sample_state_derivative():
+    """Test the evaluation of state derivatives for a batch of samples"""
+
+    system = System()
+    state_1 = State(owner=system, derivative_function=lambda data: -1)
+    state_2 = State(
+        owner=system,
+        shape=2,
+        derivative_function=lambda data: (-state_2(data)[1], state_2(data)[0]),
+    )
+    state_3 = State(
+        owner=system, shape=2, derivative_function=lambda data: (1, 2)
+    )
+    State(owner=system, shape=(2, 2), derivative_function=None)
+
+    times = np.r_[0.0, 1.0, 2.0]
+    states = np.arange(system.num_states * times.shape[0], dtype=float)
+    states = states.reshape(system.num_states, times.shape[0])
+
+    system_state = SystemState(system=system, time=times, state=states)
+    state_derivative = system.state_derivative(system_state)
+
+    assert state_derivative.shape == states.shape
+    npt.assert_equal(state_derivative[state_1.state_slice], -1)
+    npt.assert_equal(
+        state_derivative[state_2.state_slice],
+        [-states[state_2.state_index + 1], states[state_2.state_index]],
+    )
+    npt.assert_equal(
+        state_derivative[state_3.state_slice], [[1, 1, 1], [2, 2, 2]]
+    )
+    npt.assert_equal(state_derivative[state_3.state_index + 2 :], 0)
+
+    # Each sample must give the same result as a single evaluation
+    for index, time in enumerate(times):
+        single_state = SystemState(
+            system=system, time=time, state=states[:, index]
+        )
+        npt.assert_equal(
+            system.state_derivative(single_state), state_derivative[:, index]
+        )
+
+
 def test_system_state_dictionary_access():
     """Test the deprecated dictionary access for system states"""
 
@@ -4,6 +4,7 @@ import math
 import bisect
 import numpy as np
 import pytest
+import scipy.integrate
 import scipy.signal
 from fixtures.models import (
     BouncingBall,
@@ -17,6 +18,7 @@ from modypy.blocks.linear import LTISystem, integrator
 from modypy.blocks.sources import constant
 from modypy.model import (
     Clock,
+    InputSignal,
     State,
     System,
     SystemState,
@@ -25,6 +27,7 @@ from modypy.model import (
 from modypy.simulation import (
     ExcessiveEventError,
     SimulationError,
+    SimpleEventDetector,
     SimulationResult,
     Simulator,
 )
@@ -115,6 +118,72 @@ def test_lti_simulation(lti_system_with_reference):
         npt.assert_equal(item.inputs, result.inputs[:, idx])
 
 
+@pytest.mark.parametrize(
+    "solver_method", [scipy.integrate.BDF, scipy.integrate.Radau]
+)
+def test_lti_simulation_implicit_solver(
+    lti_system_with_reference, solver_method
+):
+    """Test simulation with implicit solvers, which approximate the jacobian
+    by evaluating the state derivative"""
+    sys, ref_system, ref_time, _ = lti_system_with_reference
+
+    rtol = 1e-8
+    atol = 1e-8
+    simulator = Simulator(
+        sys, start_time=0, solver_method=solver_method, rtol=rtol, atol=atol
+    )
+    result = SimulationResult(sys, simulator.run_until(time_boundary=ref_time))
+
+    ref_time, ref_output, ref_state = scipy.signal.lsim2(
+        ref_system,
+        X0=sys.initial_condition,
+        T=result.time,
+        U=None,
+        rtol=rtol,
+        atol=atol,
+    )
+    del ref_time, ref_output
+
+    npt.assert_allclose(
+        result.state, ref_state.T, rtol=rtol * 1e3, atol=atol * 1e3
+    )
+
+
+@pytest.mark.parametrize("solver_method", ["BDF", "Radau"])
+def test_affine_jacobian(solver_method):
+    """Test that the jacobian of affine dynamics is provided to solvers
+    using the jacobian"""
+
+    system = System()
+    lag = LTISystem(
+        parent=system,
+        system_matrix=[[-1, 0], [1, -2]],
+        input_matrix=np.zeros((2, 1)),
+        output_matrix=np.eye(2),
+        feed_through_matrix=np.zeros((2, 1)),
+        initial_condition=[1.0, 0.0],
+    )
+    lag.input.connect(constant(value=[0.0]))
+
+    solver_class = getattr(scipy.integrate, solver_method)
+
+    def solver_factory(*args, **kwargs):
+        return solver_class(*args, **kwargs)
+
+    simulator = Simulator(system, start_time=0, solver_method=solver_class)
+    assert "jac" in simulator.solver_options
+    npt.assert_equal(simulator.solver_options["jac"], [[-1, 0], [1, -2]])
+    result = SimulationResult(system, simulator.run_until(1.0))
+    npt.assert_allclose(
+        lag.state(result)[0], np.exp(-result.time), rtol=1e-3, atol=1e-6
+    )
+
+    # Solvers not given as classes are not provided with the jacobian
+    simulator = Simulator(system, start_time=0, solver_method=solver_factory)
+    assert "jac" not in simulator.solver_options
+
+
 class MockupIntegrator:
     """
     Mockup integrator class to force integration error.
@@ -187,6 +256,124 @@ def test_zero_crossing_event_detection():
             pass
 
 
+@pytest.mark.parametrize("root_finder", SimpleEventDetector.ROOT_FINDERS)
+def test_simultaneous_event_localization(root_finder):
+    """Test the localization of multiple events within the same interval."""
+
+    system = System()
+    state = State(system)
+    thresholds = [0.3, 0.35, 0.7, 0.9]
+    events = [
+        ZeroCrossEventSource(
+            system,
+            event_function=lambda data, threshold=threshold: state(data)
+            - threshold,
+        )
+        for threshold in thresholds
+    ]
+
+    detector = SimpleEventDetector(
+        system=system, events=events, max_subdiv=2, root_finder=root_finder
+    )
+    locations = detector.localize_events(
+        start_time=0,
+        end_time=1,
+        state=lambda time: np.reshape(time, (1,) + np.shape(time)),
+        inputs=lambda time: system.initial_input,
+    )
+
+    assert len(locations) == len(events)
+    for event_time, event in locations:
+        threshold = thresholds[events.index(event)]
+        npt.assert_allclose(event_time, threshold, atol=1e-9)
+
+
+def test_event_value_reuse():
+    """Test the re-use of event values of the last sample for subsequent
+    localizations."""
+
+    system = System()
+    state = State(system)
+    sample_counts = []
+
+    def event_function(data):
+        sample_counts.append(np.size(data.time))
+        return state(data) - 10
+
+    event = ZeroCrossEventSource(system, event_function=event_function)
+
+    detector = SimpleEventDetector(system=system, events=[event], max_subdiv=4)
+
+    def state_trajectory(time):
+        return np.reshape(time, (1,) + np.shape(time))
+
+    def input_trajectory(_time):
+        return system.initial_input
+
+    detector.localize_events(0, 1, state_trajectory, input_trajectory)
+    detector.localize_events(1, 2, state_trajectory, input_trajectory)
+    # The state at the start of the next interval is different
+    detector.localize_events(
+        2, 3, lambda time: state_trajectory(time) + 1, input_trajectory
+    )
+
+    assert sample_counts == [5, 4, 5]
+
+
+@pytest.mark.parametrize("slope", [1, 3, 10, 100])
+def test_passive_event_listener(slope):
+    """Test that an event is not detected again after its occurrence if its
+    listener does not change the state."""
+
+    system = System()
+    state = State(
+        system, derivative_function=lambda data: slope, initial_condition=0
+    )
+    event = ZeroCrossEventSource(
+        system, event_function=lambda data: state(data) - 0.5, direction=1
+    )
+    event_values = []
+    event.register_listener(lambda data: event_values.append(state(data)))
+
+    simulator = Simulator(system, start_time=0)
+    for _ in simulator.run_until(time_boundary=1.0):
+        pass
+
+    # The event occurs only once, after the event function has left the
+    # tolerance band
+    assert len(event_values) == 1
+    assert event_values[0] > 0.5 + event.tolerance
+    npt.assert_allclose(event_values[0], 0.5, atol=1e-9)
+
+
+def test_custom_event_detector_without_events():
+    """Test that custom event detectors are only used with a callable state
+    interpolator."""
+
+    class SamplingEventDetector(SimpleEventDetector):
+        """Event detector sampling the state before checking for events"""
+
+        def localize_events(self, start_time, end_time, state, inputs):
+            state(np.array([start_time, end_time]))
+            return super().localize_events(start_time, end_time, state, inputs)
+
+    system, lag, _, _ = first_order_lag(initial_value=1.0)
+
+    simulator = Simulator(
+        system, start_time=0, event_detector=SamplingEventDetector
+    )
+    result = SimulationResult(system, simulator.run_until(1.0))
+    npt.assert_allclose(lag.state(result), np.exp(-result.time), rtol=1e-6)
+
+
+def test_invalid_root_finder():
+    """Test the detection of unknown root finders."""
+
+    system = System()
+    with pytest.raises(ValueError):
+        SimpleEventDetector(system=system, events=[], root_finder="unknown")
+
+
 def test_excessive_events_second_level():
     """Test the detection of excessive events when it is introduced by
     toggling the same event over and over."""
@@ -268,6 +455,68 @@ def test_clock_handling():
     npt.assert_almost_equal(hold3(result), initial_value)
 
 
+def test_solver_continuation():
+    """Test that clock ticks not changing the state do not interrupt the
+    integration."""
+
+    system, lag, _, _ = first_order_lag(initial_value=1.0)
+    tick_count = []
+    clock = Clock(system, period=0.1)
+    clock.register_listener(lambda data: tick_count.append(data.time))
+
+    solvers = []
+
+    def solver_method(*args, **kwargs):
+        solvers.append(scipy.integrate.DOP853(*args, **kwargs))
+        return solvers[-1]
+
+    simulator = Simulator(system, start_time=0, solver_method=solver_method)
+    result = SimulationResult(system)
+    result.collect_from(simulator.run_until(0.55, include_last=False))
+    result.collect_from(simulator.run_until(1.0))
+
+    assert len(tick_count) == 11
+    assert len(solvers) == 1
+    npt.assert_allclose(lag.state(result), np.exp(-result.time), rtol=1e-6)
+
+
+def test_solver_restart_step_size():
+    """Test that a new solver created after a change of the state starts with
+    the step size of the previous solver."""
+
+    system = System()
+    state = State(
+        system,
+        derivative_function=lambda data: -state(data),
+        initial_condition=1,
+    )
+    clock = Clock(system, period=0.5)
+
+    def _reset_state(data):
+        data[state] = 1
+
+    clock.register_listener(_reset_state)
+
+    first_steps = []
+
+    class RecordingSolver(scipy.integrate.DOP853):
+        """Solver recording the initial step size it is created with"""
+
+        def __init__(self, *args, **kwargs):
+            first_steps.append(kwargs.get("first_step"))
+            super().__init__(*args, **kwargs)
+
+    simulator = Simulator(system, start_time=0, solver_method=RecordingSolver)
+    result = SimulationResult(system, simulator.run_until(2.0))
+
+    assert len(first_steps) == 4
+    assert first_steps[0] is None
+    assert all(0 < first_step <= 0.5 for first_step in first_steps[1:])
+    npt.assert_allclose(
+        state(result), np.exp(-np.mod(result.time, 0.5)), rtol=1e-6
+    )
+
+
 def test_discrete_only():
     """Test a system with only discrete-time states."""
 
@@ -307,6 +556,62 @@ def test_integrator():
     npt.assert_almost_equal(int_output(result).ravel(), result.time)
 
 
+def test_simulation_result_growth():
+    """Test the extension of the storage space of simulation results"""
+
+    system = System()
+    state = State(system, shape=2)
+    input_signal = InputSignal(system)
+
+    result = SimulationResult(system)
+    sample_count = 1000
+    for idx in range(sample_count):
+        result.append(
+            SystemState(
+                time=idx,
+                system=system,
+                state=np.r_[idx, -idx],
+                inputs=np.r_[2 * idx],
+            )
+        )
+
+    assert len(result) == sample_count
+    npt.assert_equal(result.time, np.arange(sample_count))
+    npt.assert_equal(
+        state(result), [np.arange(sample_count), -np.arange(sample_count)]
+    )
+    npt.assert_equal(input_signal(result), 2 * np.arange(sample_count))
+
+
+def test_simulation_result_multiple_samples():
+    """Test appending multiple samples to simulation results at once"""
+
+    system = System()
+    state = State(system, shape=2)
+    input_signal = InputSignal(system)
+
+    result = SimulationResult(system)
+    result.append(SystemState(time=0, system=system))
+    sample_count = 100
+    times = np.arange(1, sample_count + 1)
+    result.append(
+        SystemState(
+            time=times,
+            system=system,
+            state=np.array([times, -times]),
+            inputs=np.array([2 * times]),
+        )
+    )
+
+    assert len(result) == sample_count + 1
+    npt.assert_equal(result.time, np.arange(sample_count + 1))
+    npt.assert_equal(
+        state(result),
+        [np.arange(sample_count + 1), -np.arange(sample_count + 1)],
+    )
+    npt.assert_equal(input_signal(result), 2 * np.arange(sample_count + 1))
+
+
 def test_simulation_result_dictionary_access():
     """Test the deprecated dictionary access for simulation results"""
 